@@ -3,196 +3,298 @@
 # Phase 1: Added root selection service and routes
 # ═══════════════════════════════════════════════════════════════════════════════
 
-import issues_fs_service_ui__console
-from osbot_utils.utils.Env                                                                       import get_env
-from memory_fs.Memory_FS                                                                         import Memory_FS
-from issues_fs_service.fast_api.routes.Routes__Comments                                          import Routes__Comments
-from issues_fs_service.fast_api.routes.phase_1.Routes__Roots                                     import Routes__Roots
-from issues_fs_service.fast_api.routes.phase_1.Routes__Issues                                    import Routes__Issues
-from issues_fs.schemas.issues.phase_1.Schema__Root              import Schema__Root__Select__Request
-from issues_fs.issues.graph_services.Comments__Service  import Comments__Service
-from issues_fs.issues.phase_1.Issue__Children__Service  import Issue__Children__Service
-from issues_fs.issues.phase_1.Root__Issue__Service      import Root__Issue__Service
-from issues_fs.issues.phase_1.Root__Selection__Service  import Root__Selection__Service
-from osbot_fast_api_serverless.fast_api.routes.Routes__Info                                      import Routes__Info
-from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path                import Safe_Str__File__Path
-from memory_fs.storage_fs.providers.Storage_FS__Local_Disk                                       import Storage_FS__Local_Disk
-from memory_fs.storage_fs.providers.Storage_FS__Memory                                           import Storage_FS__Memory
-from issues_fs_service.fast_api.routes.Routes__Links                                             import Routes__Links
-from issues_fs_service.fast_api.routes.Routes__Nodes                                             import Routes__Nodes
-from issues_fs_service.fast_api.routes.Routes__Server                                            import Routes__Server
-from issues_fs_service.fast_api.routes.Routes__Types                                             import Routes__Types
-from issues_fs.issues.graph_services.Graph__Repository  import Graph__Repository
-from issues_fs.issues.graph_services.Link__Service      import Link__Service
-from issues_fs.issues.graph_services.Node__Service      import Node__Service
-from issues_fs.issues.graph_services.Type__Service      import Type__Service
-from issues_fs.issues.status.Git__Status__Service       import Git__Status__Service
-from issues_fs.issues.status.Index__Status__Service     import Index__Status__Service
-from issues_fs.issues.status.Server__Status__Service    import Server__Status__Service
-from issues_fs.issues.status.Storage__Status__Service   import Storage__Status__Service
-from issues_fs.issues.status.Types__Status__Service     import Types__Status__Service
-from issues_fs.issues.storage.Path__Handler__Graph_Node import Path__Handler__Graph_Node
-from osbot_fast_api.api.routes.Routes__Set_Cookie                                                import Routes__Set_Cookie
-from starlette.responses                                                                         import RedirectResponse
-from starlette.staticfiles                                                                       import StaticFiles
-from osbot_fast_api.api.decorators.route_path                                                    import route_path
-from osbot_fast_api_serverless.fast_api.Serverless__Fast_API                                     import Serverless__Fast_API
-from issues_fs_service_ui.config                                                                 import UI__CONSOLE__ROUTE__CONSOLE, FAST_API__TITLE, FAST_API__DESCRIPTION, UI__CONSOLE__MAJOR__VERSION, UI__CONSOLE__LATEST__VERSION, UI__CONSOLE__ROUTE__START_PAGE
-from issues_fs_service_ui.utils.Version                                                          import version__issues_fs_service_ui
-
-ROUTES_PATHS__CONSOLE = [f'/{UI__CONSOLE__ROUTE__CONSOLE}',
-                         '/events/server']
+import asyncio
+import logging
+import os
+import threading
+from osbot_utils.decorators.methods.cache_on_self                                import cache_on_self
+from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path import Safe_Str__File__Path
+from osbot_fast_api_serverless.fast_api.Serverless__Fast_API                     import Serverless__Fast_API
+from issues_fs_service_ui.config                                                 import UI__CONSOLE__ROUTE__CONSOLE, FAST_API__TITLE, FAST_API__DESCRIPTION, UI__CONSOLE__MAJOR__VERSION, UI__CONSOLE__LATEST__VERSION, UI__CONSOLE__ROUTE__START_PAGE
+from issues_fs_service_ui.fast_api.Issues_FS__Service_UI__Providers              import Issues_FS__Service_UI__Providers
+from issues_fs_service_ui.schemas.Enum__Issues_FS__Storage_Mode                  import Enum__Issues_FS__Storage_Mode
+from issues_fs_service_ui.utils.Version                                          import version__issues_fs_service_ui
+
+ROUTES_PATHS__CONSOLE = frozenset((f'/{UI__CONSOLE__ROUTE__CONSOLE}',            # Only used for membership checks
+                                    '/events/server'                ))
+
+BOOTSTRAP__EXEMPT_PATHS = (f'/{UI__CONSOLE__ROUTE__CONSOLE}',                    # Path prefixes served without waiting for bootstrap
+                           '/info'            ,
+                           '/auth'            ,
+                           '/docs'            ,
+                           '/redoc'           ,
+                           '/openapi.json'    )
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Environment Variable Names
 # ═══════════════════════════════════════════════════════════════════════════════
 
 DEFAULT__ISSUES_PATH       = '.issues'
+DEFAULT__TMPFS_FOLDER      = '/dev/shm'                                          # Not available on macOS
+DEFAULT__TMPFS_SUB_FOLDER  = 'issues_fs'                                         # tmpfs data lives under /dev/shm/issues_fs/<absolute ISSUES__PATH>
 ENV_VAR__ISSUES__IN_MEMORY = 'ISSUES__IN_MEMORY'                                 # Set to 'false' to use local disk
+ENV_VAR__ISSUES__STORAGE   = 'ISSUES__STORAGE'                                   # 'memory', 'tmpfs' or 'disk' (overrides ISSUES__IN_MEMORY)
 ENV_VAR__ISSUES__PATH      = 'ISSUES__PATH'                                      # Path to .issues folder
 ENV_VAR__ISSUES__ROOT_PATH = 'ISSUES__ROOT_PATH'                                 # Default root path within issues
+ENV_VAR__ISSUES__DIRECT_IO = 'ISSUES__DIRECT_IO'                                 # Set to 'true' to bypass the page cache (disk storage only)
+ENV_VALUES__FALSE          = frozenset(('false', '0', 'no', 'off'))              # Values that disable a boolean env var
+
+logger = logging.getLogger(__name__)
 
 
 class Issues_FS__Service_UI__Fast_API(Serverless__Fast_API):
-    run_in_memory   : bool                 = True
-    issues_path     : Safe_Str__File__Path = DEFAULT__ISSUES_PATH
-    root_path       : Safe_Str__File__Path = ''                                  # Root path within issues
-    memory_fs       : Memory_FS            = None
-    path_handler    : Path__Handler__Graph_Node = None                           # Shared path handler
-
-    # Core services
-    graph_repository      : Graph__Repository    = None
-    link_service          : Link__Service        = None
-    node_service          : Node__Service        = None
-    type_service          : Type__Service        = None
-    comments_service      : Comments__Service    = None
-
-    # Phase 1: Root selection services
-    root_selection_service  : Root__Selection__Service  = None
-    root_issue_service      : Root__Issue__Service      = None
-    issue_children_service  : Issue__Children__Service  = None
-
-    # Status services
-    storage_status__service : Storage__Status__Service = None
-    git_status__service     : Git__Status__Service     = None
-    types_status__service   : Types__Status__Service   = None
-    index_status__service   : Index__Status__Service   = None
-    server_status_service   : Server__Status__Service  = None
+    run_in_memory     : bool                 = True
+    issues_path       : Safe_Str__File__Path = DEFAULT__ISSUES_PATH
+    root_path         : Safe_Str__File__Path = ''                                # Root path within issues
+    current_root_path : str                  = ''                                # Plain str of the active root, set in setup_services
+    providers         : Issues_FS__Service_UI__Providers                         # Lazy builders for all services (pass a subclass to override them)
+    setup_completed   : bool                 = False                             # setup() only runs once per app
+    bootstrapped      : bool                 = False                             # Set once default types and root issue exist
+    bootstrap_task    : asyncio.Task         = None                              # Background bootstrap started on app startup
+    bootstrap_error   : str                  = ''                                # Set if bootstrap failed (it is not retried)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.setup_lock     = threading.Lock()                                   # Guards setup() against concurrent first calls
+        self.bootstrap_lock = threading.Lock()                                   # Serialises the startup bootstrap with request-triggered ones
 
     def setup(self):
-        with self.config as _:
-            _.name           = FAST_API__TITLE
-            _.version        = version__issues_fs_service_ui
-            _.description    = FAST_API__DESCRIPTION
-
-            self.setup_services()
-
-        return super().setup()
-
-    def setup_routes(self):
-        self.add_routes(Routes__Links   , service = self.link_service          )
-        self.add_routes(Routes__Nodes   , service = self.node_service          )
-        self.add_routes(Routes__Types   , service = self.type_service          )
-        self.add_routes(Routes__Server  , service = self.server_status_service )
-        self.add_routes(Routes__Comments, service = self.comments_service      )
-        self.add_routes(Routes__Roots   , service = self.root_selection_service)  # Phase 1
-        self.add_routes(Routes__Issues  , service = self.issue_children_service)  # Phase 1
+        with self.setup_lock:
+            if self.setup_completed:                                             # Already set up: don't re-mount routes or re-add handlers
+                return self
+
+            with self.config as _:
+                _.name           = FAST_API__TITLE
+                _.version        = version__issues_fs_service_ui
+                _.description    = FAST_API__DESCRIPTION
+
+                self.setup_services()
+
+            result = super().setup()
+            self.setup_events()
+            self.setup_completed = True
+            return result
+
+    def setup_routes(self):                                                      # Route modules are imported here, not at module load
+        from issues_fs_service.fast_api.routes.Routes__Comments         import Routes__Comments
+        from issues_fs_service.fast_api.routes.Routes__Links            import Routes__Links
+        from issues_fs_service.fast_api.routes.Routes__Nodes            import Routes__Nodes
+        from issues_fs_service.fast_api.routes.Routes__Server           import Routes__Server
+        from issues_fs_service.fast_api.routes.Routes__Types            import Routes__Types
+        from issues_fs_service.fast_api.routes.phase_1.Routes__Issues   import Routes__Issues
+        from issues_fs_service.fast_api.routes.phase_1.Routes__Roots    import Routes__Roots
+        from osbot_fast_api.api.routes.Routes__Set_Cookie               import Routes__Set_Cookie
+        from osbot_fast_api_serverless.fast_api.routes.Routes__Info     import Routes__Info
+
+        with self.providers as _:                                                # One instance per service, all sharing the same Graph__Repository
+            self.add_routes(Routes__Links   , service = _.link_service          ())
+            self.add_routes(Routes__Nodes   , service = _.node_service          ())
+            self.add_routes(Routes__Types   , service = _.type_service          ())
+            self.add_routes(Routes__Server  , service = _.server_status_service ())
+            self.add_routes(Routes__Comments, service = _.comments_service      ())
+            self.add_routes(Routes__Roots   , service = _.root_selection_service())  # Phase 1
+            self.add_routes(Routes__Issues  , service = _.issue_children_service())  # Phase 1
 
         self.add_routes(Routes__Info)
         self.add_routes(Routes__Set_Cookie)
 
+    def setup_middlewares(self):                                                 # Added first so it runs innermost: CORS, API key check and request id wrap it
+        from issues_fs_service_ui.fast_api.Middleware__Bootstrap        import Middleware__Bootstrap
+        self.app().add_middleware(Middleware__Bootstrap, fast_api=self)
+        return super().setup_middlewares()
+
+    def setup_events(self):
+        self.app().add_event_handler('startup', self.bootstrap__start)
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Service Setup
     # ═══════════════════════════════════════════════════════════════════════════════
 
-    def setup_services(self):                                                    # Initialize the service dependency chain
-        use_memory  = self.resolve_storage_mode()
-        issues_path = self.resolve_issues_path()
-        root_path   = self.resolve_root_path()
+    def setup_services(self):                                                    # Only resolve config, services are built on first use
+        storage_mode, issues_path, root_path, direct_io = self.resolve_config()
 
-        if use_memory:
-            storage_fs      = Storage_FS__Memory()
-            path_base       = issues_path                                        # Memory storage needs full path prefix
-        else:
+        if storage_mode != Enum__Issues_FS__Storage_Mode.MEMORY:
             self.run_in_memory = False
-            storage_fs      = Storage_FS__Local_Disk(root_path=issues_path)
-            path_base       = ''                                                 # Local disk storage already rooted at issues_path
-
-        self.memory_fs    = Memory_FS(storage_fs=storage_fs)
-        self.path_handler = Path__Handler__Graph_Node(base_path=path_base)
-
-        self.graph_repository = Graph__Repository(memory_fs    = self.memory_fs   ,
-                                                  path_handler = self.path_handler)
-
-        # Core services
-        self.type_service     = Type__Service    (repository = self.graph_repository)
-        self.node_service     = Node__Service    (repository = self.graph_repository)
-        self.link_service     = Link__Service    (repository = self.graph_repository)
-        self.comments_service = Comments__Service(repository = self.graph_repository)
-
-        # Phase 1: Root selection services
-        self.root_selection_service = Root__Selection__Service(repository   = self.graph_repository,
-                                                               path_handler = self.path_handler    )
-        self.root_issue_service     = Root__Issue__Service    (repository   = self.graph_repository,
-                                                               path_handler = self.path_handler    )
-        self.issue_children_service = Issue__Children__Service(repository   = self.graph_repository,
-                                                               path_handler = self.path_handler    )
-
-        # Status services
-        self.storage_status__service = Storage__Status__Service(storage_fs   = storage_fs)
-        self.git_status__service     = Git__Status__Service    ()
-        self.types_status__service   = Types__Status__Service  (type_service = self.type_service  )
-        self.index_status__service   = Index__Status__Service  (type_service = self.type_service  ,
-                                                                repository   = self.graph_repository)
-        self.server_status_service   = Server__Status__Service(storage_service = self.storage_status__service,
-                                                               git_service     = self.git_status__service    ,
-                                                               types_service   = self.types_status__service  ,
-                                                               index_service   = self.index_status__service  )
-
-        # Initialize defaults
+
+        with self.providers as _:
+            _.storage_mode = storage_mode
+            _.direct_io    = direct_io and storage_mode == Enum__Issues_FS__Storage_Mode.DISK
+            _.issues_path  = issues_path                                         # Already mapped into /dev/shm for tmpfs
+
+        if root_path:                                                            # Common case (no root configured) skips the Safe_Str re-validation
+            self.root_path     = root_path
+        if self.root_path:                                                       # Cache the sanitised Safe_Str value, not the raw env string
+            self.current_root_path = str(self.root_path)
+        else:
+            self.current_root_path = str(self.issues_path)
+
+    def bootstrap(self):                                                         # One-time defaults, safe to call from any thread
+        with self.bootstrap_lock:
+            if self.bootstrapped or self.bootstrap_error:
+                return
+            try:
+                self.bootstrap__defaults()
+            except Exception as error:
+                self.bootstrap_error = f'{type(error).__name__}: {error}'
+                logger.exception('Issues-FS bootstrap failed')                   # Logged once, later requests get a 503 with the error
+                raise
+            self.bootstrapped = True
+
+    def bootstrap__defaults(self):
         self.type_service.initialize_default_types()
         self.root_issue_service.ensure_root_issue_exists()                       # Phase 1: Create root GitRepo-1
 
-        # Apply configured root if set
-        if root_path:
-            self.root_selection_service.set_current_root(Schema__Root__Select__Request(path=root_path))
+        root_path = self.resolve_root_path()                                     # Plain str from the cached config, not the Safe_Str field
+        if root_path:                                                            # Apply configured root if set
+            self.root_selection_service.set_current_root(self.root_select_request(root_path))
 
-        self.root_path = root_path
+    def root_select_request(self, root_path: str):                               # Only imported and built when a root is configured
+        from issues_fs.schemas.issues.phase_1.Schema__Root import Schema__Root__Select__Request
+        return Schema__Root__Select__Request(path=root_path)
+
+    def bootstrap__background(self):
+        try:
+            self.bootstrap()
+        except Exception:                                                        # Already logged and stored in bootstrap_error
+            pass
+
+    async def bootstrap__start(self):                                            # Startup handler: bootstrap off the critical path
+        self.bootstrap_task = asyncio.create_task(asyncio.to_thread(self.bootstrap__background))  # Keep a reference so the task isn't garbage collected
+
+    async def bootstrap__wait(self, path: str):                                  # Used by Middleware__Bootstrap: returns a 503 response if bootstrap failed
+        if self.bootstrapped or path.startswith(BOOTSTRAP__EXEMPT_PATHS):
+            return None
+        await asyncio.to_thread(self.bootstrap__background)                      # Waits on the lock if the startup bootstrap is still running
+        if self.bootstrap_error:
+            from starlette.responses import JSONResponse
+            return JSONResponse(status_code=503, content={'error': f'Issues-FS bootstrap failed: {self.bootstrap_error}'})
+        return None
 
     # ═══════════════════════════════════════════════════════════════════════════════
-    # Configuration Resolution
+    # Services (built by the providers)
+    #
+    # Read-only: these used to be Type_Safe fields. Assigning one
+    # (app.type_service = X) or passing it to the constructor
+    # (memory_fs=X) now raises AttributeError; only a None kwarg is silently
+    # ignored. To replace a service, pass a providers subclass that overrides
+    # it: Issues_FS__Service_UI__Fast_API(providers=...)
     # ═══════════════════════════════════════════════════════════════════════════════
 
-    def resolve_storage_mode(self) -> bool:
-        env_value = get_env(ENV_VAR__ISSUES__IN_MEMORY, None)
+    @property
+    def memory_fs(self):
+        return self.providers.memory_fs()
 
-        if env_value is not None:
-            return env_value.lower() not in ('false', '0', 'no', 'off')
+    @property
+    def path_handler(self):
+        return self.providers.path_handler()
 
-        return self.run_in_memory
+    @property
+    def graph_repository(self):
+        return self.providers.graph_repository()
 
-    def resolve_issues_path(self) -> str:
-        env_value = get_env(ENV_VAR__ISSUES__PATH, None)
+    @property
+    def link_service(self):
+        return self.providers.link_service()
 
-        if env_value:
-            return env_value
+    @property
+    def node_service(self):
+        return self.providers.node_service()
 
-        return str(self.issues_path)
+    @property
+    def type_service(self):
+        return self.providers.type_service()
 
-    def resolve_root_path(self) -> str:
-        env_value = get_env(ENV_VAR__ISSUES__ROOT_PATH, None)
+    @property
+    def comments_service(self):
+        return self.providers.comments_service()
 
-        if env_value:
-            return env_value
+    @property
+    def root_selection_service(self):                                           # Phase 1
+        return self.providers.root_selection_service()
 
-        if self.root_path:
-            return str(self.root_path)
+    @property
+    def root_issue_service(self):                                               # Phase 1
+        return self.providers.root_issue_service()
+
+    @property
+    def issue_children_service(self):                                           # Phase 1
+        return self.providers.issue_children_service()
+
+    @property
+    def storage_status__service(self):
+        return self.providers.storage_status_service()
 
-        return ''
+    @property
+    def git_status__service(self):
+        return self.providers.git_status_service()
+
+    @property
+    def types_status__service(self):
+        return self.providers.types_status_service()
+
+    @property
+    def index_status__service(self):
+        return self.providers.index_status_service()
+
+    @property
+    def server_status_service(self):
+        return self.providers.server_status_service()
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Configuration Resolution
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    # env vars don't change during the process lifetime, so they are read in one pass, once per app
+    @cache_on_self
+    def resolve_config(self) -> tuple:                                           # (storage_mode, issues_path, root_path, direct_io)
+        env           = os.environ
+        env_storage   = env.get(ENV_VAR__ISSUES__STORAGE  )
+        env_in_memory = env.get(ENV_VAR__ISSUES__IN_MEMORY)
+        env_issues    = env.get(ENV_VAR__ISSUES__PATH     )
+        env_root      = env.get(ENV_VAR__ISSUES__ROOT_PATH)
+        env_direct_io = env.get(ENV_VAR__ISSUES__DIRECT_IO)
+
+        if env_storage:
+            storage_mode = Enum__Issues_FS__Storage_Mode(env_storage.lower())   # Unknown values fail at startup
+        elif env_in_memory is not None:
+            use_memory   = env_in_memory.lower() not in ENV_VALUES__FALSE
+            storage_mode = Enum__Issues_FS__Storage_Mode.MEMORY if use_memory else Enum__Issues_FS__Storage_Mode.DISK
+        elif self.run_in_memory:
+            storage_mode = Enum__Issues_FS__Storage_Mode.MEMORY
+        else:
+            storage_mode = Enum__Issues_FS__Storage_Mode.DISK
+
+        if storage_mode == Enum__Issues_FS__Storage_Mode.TMPFS and not os.path.isdir(DEFAULT__TMPFS_FOLDER):
+            logger.warning(f'{ENV_VAR__ISSUES__STORAGE}=tmpfs but {DEFAULT__TMPFS_FOLDER} does not exist, using in-memory storage')
+            storage_mode = Enum__Issues_FS__Storage_Mode.MEMORY                 # No tmpfs here, keep data in memory instead
+
+        issues_path = env_issues or str(self.issues_path)
+        if storage_mode == Enum__Issues_FS__Storage_Mode.TMPFS:
+            issues_path = self.resolve_tmpfs_issues_path(issues_path)
+        root_path   = env_root   or (str(self.root_path) if self.root_path else '')
+        direct_io   = bool(env_direct_io) and env_direct_io.lower() not in ENV_VALUES__FALSE
+        return storage_mode, issues_path, root_path, direct_io
+
+    def resolve_tmpfs_issues_path(self, issues_path: str) -> str:                # One tmpfs folder per ISSUES__PATH, so apps on the same host don't share data
+        return os.path.join(DEFAULT__TMPFS_FOLDER, DEFAULT__TMPFS_SUB_FOLDER, os.path.abspath(issues_path).lstrip('/'))
+
+    def resolve_storage_mode(self) -> Enum__Issues_FS__Storage_Mode:
+        return self.resolve_config()[0]
+
+    def resolve_issues_path(self) -> str:
+        return self.resolve_config()[1]
+
+    def resolve_root_path(self) -> str:
+        return self.resolve_config()[2]
+
+    def resolve_direct_io(self) -> bool:
+        return self.resolve_config()[3]
 
     def get_current_root_path(self) -> str:
-        if self.root_path:
-            return self.root_path
+        if self.current_root_path:
+            return self.current_root_path
+        if self.root_path:                                                       # setup_services not called yet
+            return str(self.root_path)
         return str(self.issues_path)
 
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -200,6 +302,11 @@ class Issues_FS__Service_UI__Fast_API(Serverless__Fast_API):
     # ═══════════════════════════════════════════════════════════════════════════════
 
     def setup_static_routes(self):
+        import issues_fs_service_ui__console
+        from osbot_fast_api.api.decorators.route_path                   import route_path
+        from starlette.responses                                        import RedirectResponse
+        from issues_fs_service_ui.fast_api.StaticFiles__Cached          import StaticFiles__Cached
+
         path_static_folder  = issues_fs_service_ui__console.path
         path_static         = f"/{UI__CONSOLE__ROUTE__CONSOLE}"
         path_name           = UI__CONSOLE__ROUTE__CONSOLE
@@ -207,11 +314,13 @@ class Issues_FS__Service_UI__Fast_API(Serverless__Fast_API):
         latest_version      = UI__CONSOLE__LATEST__VERSION
         start_page          = UI__CONSOLE__ROUTE__START_PAGE
         path_latest_version = f"/{path_name}/{major_version}/{latest_version}/{start_page}.html"
-        self.app().mount(path_static, StaticFiles(directory=path_static_folder), name=path_name)
+        static_files        = StaticFiles__Cached(directory=path_static_folder, etag_version=latest_version)
+        static_files.preload(major_version)                                      # Latest console also loads files from earlier minor versions (no prewarm: that's every console file)
+        self.app().mount(path_static, static_files, name=path_name)
 
 
         @route_path(path=f'/{UI__CONSOLE__ROUTE__CONSOLE}')
-        def redirect_to_latest():
-            return RedirectResponse(url=path_latest_version)
+        def redirect_to_latest():                                                # New response per request, middleware adds headers to it
+            return RedirectResponse(url=path_latest_version, status_code=307)
 
         self.add_route_get(redirect_to_latest)
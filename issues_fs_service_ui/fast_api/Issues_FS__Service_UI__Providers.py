@@ -0,0 +1,141 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Issues_FS__Service_UI__Providers - Lazy service providers for the UI FastAPI app
+# Each service (and its module) is only imported and built on first use, and
+# built once per providers instance. Note that the Routes__* classes take their
+# service as a constructor field, so setup_routes() asks for all of them: in the
+# full app every service is still imported and built during setup()
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import logging
+from osbot_utils.decorators.methods.cache_on_self                                import cache_on_self
+from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
+from osbot_utils.utils.Files                                                     import create_folder
+from issues_fs_service_ui.schemas.Enum__Issues_FS__Storage_Mode                  import Enum__Issues_FS__Storage_Mode
+
+logger = logging.getLogger(__name__)
+
+
+class Issues_FS__Service_UI__Providers(Type_Safe):
+    storage_mode : Enum__Issues_FS__Storage_Mode = Enum__Issues_FS__Storage_Mode.MEMORY
+    issues_path  : str                           = ''                            # Resolved path to .issues folder (or its tmpfs copy)
+    direct_io    : bool                          = False                         # Disk mode only: keep file data out of the page cache
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Storage
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @cache_on_self
+    def storage_fs(self):
+        if self.storage_mode == Enum__Issues_FS__Storage_Mode.MEMORY:
+            from memory_fs.storage_fs.providers.Storage_FS__Memory import Storage_FS__Memory
+            return Storage_FS__Memory()
+        from memory_fs.storage_fs.providers.Storage_FS__Local_Disk import Storage_FS__Local_Disk
+        if self.storage_mode == Enum__Issues_FS__Storage_Mode.TMPFS:
+            create_folder(self.issues_path)                                      # tmpfs is only cleared on reboot, data survives app restarts
+        elif self.direct_io:
+            from issues_fs_service_ui.storage.Storage_FS__Local_Disk__Direct import Storage_FS__Local_Disk__Direct, direct_io_supported
+            if direct_io_supported():
+                return Storage_FS__Local_Disk__Direct(root_path=self.issues_path)
+            logger.warning('ISSUES__DIRECT_IO is set but posix_fadvise is not available here, using the page cache')
+        return Storage_FS__Local_Disk(root_path=self.issues_path)
+
+    @cache_on_self
+    def memory_fs(self):
+        from memory_fs.Memory_FS import Memory_FS
+        return Memory_FS(storage_fs=self.storage_fs())
+
+    @cache_on_self
+    def path_handler(self):                                                      # Shared path handler
+        from issues_fs.issues.storage.Path__Handler__Graph_Node import Path__Handler__Graph_Node
+        if self.storage_mode == Enum__Issues_FS__Storage_Mode.MEMORY:
+            path_base = self.issues_path                                         # Memory storage needs full path prefix
+        else:
+            path_base = ''                                                       # Local disk storage already rooted at issues_path
+        return Path__Handler__Graph_Node(base_path=path_base)
+
+    @cache_on_self
+    def graph_repository(self):
+        from issues_fs.issues.graph_services.Graph__Repository import Graph__Repository
+        return Graph__Repository(memory_fs    = self.memory_fs   (),
+                                 path_handler = self.path_handler())
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Core services
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @cache_on_self
+    def type_service(self):
+        from issues_fs.issues.graph_services.Type__Service import Type__Service
+        return Type__Service(repository=self.graph_repository())
+
+    @cache_on_self
+    def node_service(self):
+        from issues_fs.issues.graph_services.Node__Service import Node__Service
+        return Node__Service(repository=self.graph_repository())
+
+    @cache_on_self
+    def link_service(self):
+        from issues_fs.issues.graph_services.Link__Service import Link__Service
+        return Link__Service(repository=self.graph_repository())
+
+    @cache_on_self
+    def comments_service(self):
+        from issues_fs.issues.graph_services.Comments__Service import Comments__Service
+        return Comments__Service(repository=self.graph_repository())
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Phase 1: Root selection services
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @cache_on_self
+    def phase_1_kwargs(self):                                                    # Same (repository, path_handler) for every Phase 1 service
+        return dict(repository   = self.graph_repository(),
+                    path_handler = self.path_handler    ())
+
+    @cache_on_self
+    def root_selection_service(self):
+        from issues_fs.issues.phase_1.Root__Selection__Service import Root__Selection__Service
+        return Root__Selection__Service(**self.phase_1_kwargs())
+
+    @cache_on_self
+    def root_issue_service(self):
+        from issues_fs.issues.phase_1.Root__Issue__Service import Root__Issue__Service
+        return Root__Issue__Service(**self.phase_1_kwargs())
+
+    @cache_on_self
+    def issue_children_service(self):
+        from issues_fs.issues.phase_1.Issue__Children__Service import Issue__Children__Service
+        return Issue__Children__Service(**self.phase_1_kwargs())
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Status services
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @cache_on_self
+    def storage_status_service(self):
+        from issues_fs.issues.status.Storage__Status__Service import Storage__Status__Service
+        return Storage__Status__Service(storage_fs=self.storage_fs())
+
+    @cache_on_self
+    def git_status_service(self):
+        from issues_fs.issues.status.Git__Status__Service import Git__Status__Service
+        return Git__Status__Service()
+
+    @cache_on_self
+    def types_status_service(self):
+        from issues_fs.issues.status.Types__Status__Service import Types__Status__Service
+        return Types__Status__Service(type_service=self.type_service())
+
+    @cache_on_self
+    def index_status_service(self):
+        from issues_fs.issues.status.Index__Status__Service import Index__Status__Service
+        return Index__Status__Service(type_service = self.type_service    (),
+                                      repository   = self.graph_repository())
+
+    @cache_on_self
+    def server_status_service(self):
+        from issues_fs.issues.status.Server__Status__Service import Server__Status__Service
+        return Server__Status__Service(storage_service = self.storage_status_service(),
+                                       git_service     = self.git_status_service    (),
+                                       types_service   = self.types_status_service  (),
+                                       index_service   = self.index_status_service  ())
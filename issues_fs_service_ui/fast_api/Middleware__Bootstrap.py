@@ -0,0 +1,19 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Middleware__Bootstrap - Holds service requests until the app's bootstrap is done
+# Pure ASGI (not BaseHTTPMiddleware): once bootstrapped, each request costs one
+# attribute check before going straight to the inner app
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class Middleware__Bootstrap:
+
+    def __init__(self, app, fast_api):
+        self.app      = app
+        self.fast_api = fast_api                                                 # The Issues_FS__Service_UI__Fast_API that owns the bootstrap
+
+    async def __call__(self, scope, receive, send):
+        if self.fast_api.bootstrapped is False and scope['type'] == 'http':
+            response = await self.fast_api.bootstrap__wait(scope['path'])
+            if response is not None:                                             # Bootstrap failed: 503, still wrapped by CORS and request id
+                return await response(scope, receive, send)
+        await self.app(scope, receive, send)
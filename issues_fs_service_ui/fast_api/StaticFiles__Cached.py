@@ -0,0 +1,76 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# StaticFiles__Cached - StaticFiles for a folder that doesn't change while the app runs
+# Caches path lookups (full path + os.stat), uses version based ETags and can
+# hold whole sub folders in memory (responses are still built per request)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+from mimetypes                                                                   import guess_type
+from starlette.datastructures                                                    import Headers
+from starlette.responses                                                         import FileResponse, Response
+from starlette.staticfiles                                                       import StaticFiles, NotModifiedResponse
+
+STATIC_FILES__LOOKUP_CACHE_SIZE = 512                                            # Cap for lookups cached at request time (prewarm is not capped)
+STATIC_FILES__CACHE_CONTROL     = 'public, max-age=31536000, immutable'          # For preloaded (versioned) files only
+
+
+class StaticFiles__Cached(StaticFiles):                                          # Restart the app to pick up changed files
+
+    def __init__(self, *args, etag_version: str = '', **kwargs):
+        super().__init__(*args, **kwargs)
+        self.etag_version = etag_version                                         # When set, ETags are '"{etag_version}-{size}"'
+        self.lookups      = {}                                                   # Found files only: (full_path, stat_result), keyed on path
+        self.preloaded    = {}                                                   # (body, media_type, headers) keyed on the path from get_path()
+
+    def prewarm(self):                                                           # Stat every file once, so requests never hit the disk for it
+        for folder, _, file_names in os.walk(self.directory):
+            for file_name in file_names:
+                path = os.path.relpath(os.path.join(folder, file_name), self.directory)
+                if path not in self.preloaded:                                   # Preloaded files are served from memory (call preload first)
+                    self.lookups[path] = super().lookup_path(path)
+        return self
+
+    def lookup_path(self, path):                                                 # Misses are not cached, so scanners can't fill the cache
+        lookup = self.lookups.get(path)
+        if lookup is None:
+            lookup = super().lookup_path(path)
+            if lookup[1] is not None and len(self.lookups) < STATIC_FILES__LOOKUP_CACHE_SIZE:
+                self.lookups[path] = lookup
+        return lookup
+
+    def preload(self, sub_folder):                                               # Read every file under sub_folder into memory, once
+        folder_path = os.path.join(self.directory, sub_folder)
+        for folder, _, file_names in os.walk(folder_path):
+            for file_name in file_names:
+                full_path  = os.path.join(folder, file_name)
+                path       = os.path.relpath(full_path, self.directory)
+                media_type = guess_type(full_path)[0] or 'text/plain'
+                with open(full_path, 'rb') as file:
+                    body = file.read()
+                headers = {'cache-control': STATIC_FILES__CACHE_CONTROL}
+                if self.etag_version:
+                    headers['etag'] = self.etag(len(body))
+                self.preloaded[path] = (body, media_type, headers)
+        return self
+
+    def etag(self, size):
+        return f'"{self.etag_version}-{size}"'
+
+    async def get_response(self, path, scope):
+        preloaded       = self.preloaded.get(path)
+        request_headers = Headers(scope=scope)
+        if preloaded is None or scope['method'] not in ('GET', 'HEAD') or 'range' in request_headers:
+            return await super().get_response(path, scope)                       # Not preloaded (or a Range request): regular file serving
+        body, media_type, headers = preloaded
+        if self.is_not_modified(Headers(headers), request_headers):
+            return NotModifiedResponse(Headers(headers))
+        return Response(content=body, media_type=media_type, headers=headers)    # New response per request, middleware adds headers to it
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        request_headers = Headers(scope=scope)
+        response        = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        if self.etag_version:
+            response.headers['etag'] = self.etag(stat_result.st_size)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class Enum__Issues_FS__Storage_Mode(str, Enum):
+    MEMORY = 'memory'                                                            # Storage_FS__Memory, everything in the Python heap
+    TMPFS  = 'tmpfs'                                                             # Storage_FS__Local_Disk rooted in /dev/shm (kernel page cache)
+    DISK   = 'disk'                                                              # Storage_FS__Local_Disk rooted at the issues path
@@ -0,0 +1,47 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Storage_FS__Local_Disk__Direct - Local disk storage that doesn't keep file data
+# in the OS page cache (for .issues trees larger than RAM)
+#
+# Uses posix_fadvise(POSIX_FADV_DONTNEED) after each read and write, which gives
+# page-cache bypass without O_DIRECT's aligned buffer / aligned length rules.
+# Only worth enabling with near-node storage: on network file systems the page
+# cache is what hides the round trips.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path import Safe_Str__File__Path
+from memory_fs.storage_fs.providers.Storage_FS__Local_Disk                       import Storage_FS__Local_Disk
+
+
+def direct_io_supported() -> bool:                                               # Linux only (not available on macOS)
+    return hasattr(os, 'posix_fadvise')
+
+
+class Storage_FS__Local_Disk__Direct(Storage_FS__Local_Disk):                    # file__json reads through file__bytes, so it needs no override
+
+    def file__bytes(self, path):
+        data = super().file__bytes(path)
+        self.drop_page_cache(path)
+        return data
+
+    def file__str(self, path):
+        data = super().file__str(path)
+        self.drop_page_cache(path)
+        return data
+
+    def file__save(self, path, data):
+        result = super().file__save(path, data)
+        self.drop_page_cache(path, flush=True)
+        return result
+
+    def drop_page_cache(self, path, flush=False):                                # Dirty pages are never dropped, so writes are flushed first
+        try:
+            fd = os.open(self.full_path(Safe_Str__File__Path(path)), os.O_RDONLY)  # Sanitised like the parent's @type_safe reads and writes
+        except OSError:                                                          # e.g. file doesn't exist
+            return
+        try:
+            if flush:
+                os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
@@ -19,7 +19,9 @@ echo ""
 echo "Issue Tracking Configuration:"
 echo "  ISSUES_FS__UI__PORT = ${PORT}"
 echo "  ISSUES__IN_MEMORY   = ${ISSUES__IN_MEMORY:-true (default)}"
+echo "  ISSUES__STORAGE     = ${ISSUES__STORAGE:-(not set, uses ISSUES__IN_MEMORY)}"
 echo "  ISSUES__PATH        = ${ISSUES__PATH:-.issues (default)}"
+echo "  ISSUES__DIRECT_IO   = ${ISSUES__DIRECT_IO:-false (default)}"
 echo ""
 
 poetry run uvicorn issues_fs_service_ui.fast_api.lambda_handler:app --reload --host 0.0.0.0 --port $PORT \
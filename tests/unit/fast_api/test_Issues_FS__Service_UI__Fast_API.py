@@ -0,0 +1,243 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+from unittest                                                        import TestCase
+from unittest.mock                                                   import patch
+from issues_fs_service_ui.fast_api                                   import Issues_FS__Service_UI__Fast_API as fast_api_module
+from issues_fs_service_ui.fast_api.Issues_FS__Service_UI__Fast_API   import Issues_FS__Service_UI__Fast_API
+from issues_fs_service_ui.fast_api.Middleware__Bootstrap             import Middleware__Bootstrap
+from issues_fs_service_ui.schemas.Enum__Issues_FS__Storage_Mode      import Enum__Issues_FS__Storage_Mode
+
+ENV_VARS__ISSUES = ('ISSUES__STORAGE', 'ISSUES__IN_MEMORY', 'ISSUES__PATH', 'ISSUES__ROOT_PATH', 'ISSUES__DIRECT_IO')
+
+
+class Fast_API__Controlled_Bootstrap(Issues_FS__Service_UI__Fast_API):          # bootstrap__defaults blocks until released, and can fail
+    defaults_calls : int  = 0
+    defaults_fail  : bool = False
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.defaults_started = threading.Event()
+        self.defaults_release = threading.Event()
+
+    def bootstrap__defaults(self):
+        self.defaults_calls += 1
+        self.defaults_started.set()
+        self.defaults_release.wait(timeout=5)
+        if self.defaults_fail:
+            raise ValueError('no types')
+
+
+class Fast_API__No_Routes(Fast_API__Controlled_Bootstrap):                        # The Routes__* classes are not needed to check setup() itself
+    def setup_routes(self):
+        pass
+
+
+async def inner_app(scope, receive, send):                                      # Stands in for the rest of the app's middleware and routes
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body' , 'body'  : b'inner'             })
+
+async def asgi_get(fast_api, path):                                              # Raw ASGI call through Middleware__Bootstrap, returns (status, body)
+    messages = []
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+    async def send(message):
+        messages.append(message)
+    scope = {'type': 'http', 'method': 'GET', 'path': path, 'root_path': '', 'query_string': b'', 'headers': []}
+    await Middleware__Bootstrap(app=inner_app, fast_api=fast_api)(scope, receive, send)
+    return messages[0]['status'], b''.join(message.get('body', b'') for message in messages[1:])
+
+
+class test_Issues_FS__Service_UI__Fast_API__bootstrap(TestCase):
+
+    def setUp(self):
+        self.fast_api = Fast_API__Controlled_Bootstrap()
+
+    def test__bootstrap__runs_once(self):
+        with self.fast_api as _:
+            _.defaults_release.set()
+            _.bootstrap()
+            _.bootstrap()
+            assert _.bootstrapped   is True
+            assert _.defaults_calls == 1
+
+    def test__bootstrap__lock_is_per_instance(self):
+        other = Fast_API__Controlled_Bootstrap()
+        assert self.fast_api.bootstrap_lock is not other.bootstrap_lock
+
+    def test__setup_lock__per_instance(self):
+        other = Fast_API__Controlled_Bootstrap()
+        assert self.fast_api.setup_lock is not other.setup_lock
+        with self.fast_api.setup_lock:
+            assert other.setup_lock.acquire(blocking=False) is True              # Another app is never blocked by this one's setup
+            other.setup_lock.release()
+
+    def test__setup__second_call_changes_nothing(self):
+        with Fast_API__No_Routes() as _:
+            assert _.setup() is _
+            app         = _.app()
+            routes      = list(app.routes)
+            middlewares = list(app.user_middleware)
+            on_startup  = list(app.router.on_startup)
+            assert _.setup_completed is True
+            assert _.setup()         is _
+            assert app.routes               == routes
+            assert app.user_middleware      == middlewares
+            assert app.router.on_startup    == on_startup
+            assert on_startup.count(_.bootstrap__start) == 1
+
+    def test__bootstrap__wait__exempt_paths_served_before_bootstrap(self):
+        with self.fast_api as _:
+            background = threading.Thread(target=_.bootstrap__background)
+            background.start()
+            assert _.defaults_started.wait(timeout=2)                           # startup bootstrap is in flight (and blocked)
+
+            for path in ['/console', '/console/v0/v0.1/v0.1.6/index.html', '/info/health', '/auth/set-cookie-form', '/docs']:
+                result = asyncio.run(asyncio.wait_for(asgi_get(_, path), timeout=1))
+                assert result == (200, b'inner')
+            assert _.bootstrapped is False
+
+            _.defaults_release.set()
+            background.join(timeout=2)
+
+    def test__bootstrap__wait__service_paths_wait_for_bootstrap(self):
+        with self.fast_api as _:
+            background = threading.Thread(target=_.bootstrap__background)
+            background.start()
+            assert _.defaults_started.wait(timeout=2)
+
+            async def request_while_bootstrapping():
+                task = asyncio.create_task(asgi_get(_, '/types/list'))
+                await asyncio.sleep(0.1)
+                assert task.done() is False                                      # held until bootstrap finishes
+                _.defaults_release.set()
+                return await asyncio.wait_for(task, timeout=2)
+
+            assert asyncio.run(request_while_bootstrapping()) == (200, b'inner')
+            assert _.bootstrapped   is True
+            assert _.defaults_calls == 1                                         # the request joined the in-flight bootstrap
+            background.join(timeout=2)
+
+    def test__bootstrap__wait__runs_bootstrap_without_startup_event(self):
+        with self.fast_api as _:
+            _.defaults_release.set()
+            assert asyncio.run(asgi_get(_, '/types/list')) == (200, b'inner')
+            assert _.bootstrapped is True
+
+    def test__bootstrap__failure_is_stored_and_not_retried(self):
+        with self.fast_api as _:
+            _.defaults_fail = True
+            _.defaults_release.set()
+            with self.assertLogs('issues_fs_service_ui.fast_api.Issues_FS__Service_UI__Fast_API', level='ERROR'):
+                status_1, _body = asyncio.run(asgi_get(_, '/types/list'))
+            status_2, body  = asyncio.run(asgi_get(_, '/types/list'))
+
+            assert _.bootstrapped         is False
+            assert _.bootstrap_error      == 'ValueError: no types'
+            assert _.defaults_calls       == 1
+            assert status_1               == 503
+            assert status_2               == 503
+            assert b'ValueError: no types' in body
+
+    def test__bootstrap__wait__skipped_once_bootstrapped(self):
+        with self.fast_api as _:
+            _.bootstrapped = True
+            with patch.object(Fast_API__Controlled_Bootstrap, 'bootstrap__wait') as bootstrap__wait:
+                assert asyncio.run(asgi_get(_, '/types/list')) == (200, b'inner')
+            bootstrap__wait.assert_not_called()
+            assert _.defaults_calls == 0
+
+    def test__setup_middlewares__bootstrap_runs_inside_cors_and_request_id(self):
+        with Fast_API__Controlled_Bootstrap() as _:
+            _.setup_middlewares()
+            middlewares = [middleware.cls.__name__ for middleware in _.app().user_middleware]   # Outermost first
+            assert middlewares[-1] == 'Middleware__Bootstrap'
+            assert middlewares.index('Middleware__Request_ID') < middlewares.index('Middleware__Bootstrap')
+            assert middlewares.index('CORSMiddleware'        ) < middlewares.index('Middleware__Bootstrap')
+
+
+class test_Issues_FS__Service_UI__Fast_API__resolve_config(TestCase):
+
+    def setUp(self):
+        self.tmpfs_folder = tempfile.mkdtemp()                                   # Stands in for /dev/shm
+        self.addCleanup(shutil.rmtree, self.tmpfs_folder, ignore_errors=True)
+        self.env          = {name: value for name, value in os.environ.items() if name not in ENV_VARS__ISSUES}
+
+    def resolve_config(self, fast_api=None, **env_vars):                         # New app per call, resolve_config is cached per instance
+        fast_api = fast_api or Issues_FS__Service_UI__Fast_API()
+        with patch.dict(os.environ, {**self.env, **env_vars}, clear=True):
+            with patch.object(fast_api_module, 'DEFAULT__TMPFS_FOLDER', self.tmpfs_folder):
+                return fast_api.resolve_config()
+
+    def storage_mode(self, **env_vars):
+        return self.resolve_config(**env_vars)[0]
+
+    def test__defaults(self):
+        assert self.resolve_config() == (Enum__Issues_FS__Storage_Mode.MEMORY, '.issues', '', False)
+        assert self.resolve_config(Issues_FS__Service_UI__Fast_API(run_in_memory=False))[0] == Enum__Issues_FS__Storage_Mode.DISK
+
+    def test__storage_mode__from_issues_storage(self):
+        assert self.storage_mode(ISSUES__STORAGE='memory') == Enum__Issues_FS__Storage_Mode.MEMORY
+        assert self.storage_mode(ISSUES__STORAGE='tmpfs' ) == Enum__Issues_FS__Storage_Mode.TMPFS
+        assert self.storage_mode(ISSUES__STORAGE='disk'  ) == Enum__Issues_FS__Storage_Mode.DISK
+        assert self.storage_mode(ISSUES__STORAGE='DISK'  ) == Enum__Issues_FS__Storage_Mode.DISK
+
+    def test__storage_mode__issues_storage_overrides_in_memory(self):
+        assert self.storage_mode(ISSUES__STORAGE='disk', ISSUES__IN_MEMORY='true') == Enum__Issues_FS__Storage_Mode.DISK
+
+    def test__storage_mode__from_issues_in_memory(self):
+        assert self.storage_mode(ISSUES__IN_MEMORY='true' ) == Enum__Issues_FS__Storage_Mode.MEMORY
+        assert self.storage_mode(ISSUES__IN_MEMORY='false') == Enum__Issues_FS__Storage_Mode.DISK
+        assert self.storage_mode(ISSUES__IN_MEMORY='0'    ) == Enum__Issues_FS__Storage_Mode.DISK
+        assert self.storage_mode(ISSUES__IN_MEMORY='Off'  ) == Enum__Issues_FS__Storage_Mode.DISK
+
+    def test__storage_mode__bad_value_raises(self):
+        with self.assertRaises(ValueError):
+            self.storage_mode(ISSUES__STORAGE='ramdisk')
+
+    def test__storage_mode__tmpfs_falls_back_to_memory(self):
+        os.rmdir(self.tmpfs_folder)                                              # No /dev/shm (e.g. macOS)
+        with self.assertLogs('issues_fs_service_ui.fast_api.Issues_FS__Service_UI__Fast_API', level='WARNING') as logs:
+            storage_mode, issues_path, _, _ = self.resolve_config(ISSUES__STORAGE='tmpfs', ISSUES__PATH='/repo/.issues')
+        assert 'using in-memory storage' in logs.output[0]
+        assert storage_mode == Enum__Issues_FS__Storage_Mode.MEMORY
+        assert issues_path  == '/repo/.issues'
+
+    def test__issues_path__tmpfs_folder_per_issues_path(self):
+        issues_path_1 = self.resolve_config(ISSUES__STORAGE='tmpfs', ISSUES__PATH='/repo-1/.issues')[1]
+        issues_path_2 = self.resolve_config(ISSUES__STORAGE='tmpfs', ISSUES__PATH='/repo-2/.issues')[1]
+        assert issues_path_1 == os.path.join(self.tmpfs_folder, 'issues_fs', 'repo-1', '.issues')
+        assert issues_path_2 == os.path.join(self.tmpfs_folder, 'issues_fs', 'repo-2', '.issues')
+
+    def test__issues_path__and_root_path(self):
+        config = self.resolve_config(ISSUES__STORAGE='disk', ISSUES__PATH='/repo/.issues', ISSUES__ROOT_PATH='data/issues')
+        assert config == (Enum__Issues_FS__Storage_Mode.DISK, '/repo/.issues', 'data/issues', False)
+
+    def test__direct_io(self):
+        assert self.resolve_config(ISSUES__DIRECT_IO='true' )[3] is True
+        assert self.resolve_config(ISSUES__DIRECT_IO='false')[3] is False
+        assert self.resolve_config(ISSUES__DIRECT_IO=''     )[3] is False
+
+    def setup_services(self, **env_vars):
+        fast_api = Issues_FS__Service_UI__Fast_API()
+        with patch.dict(os.environ, {**self.env, **env_vars}, clear=True):
+            fast_api.setup_services()
+        return fast_api
+
+    def test__get_current_root_path__sanitised(self):                            # The Safe_Str value, not the raw ISSUES__ROOT_PATH string
+        fast_api = self.setup_services(ISSUES__ROOT_PATH='data/My Root!')
+        assert fast_api.current_root_path       == 'data/My Root_'
+        assert fast_api.get_current_root_path() == 'data/My Root_'
+        assert type(fast_api.current_root_path) is str
+
+    def test__get_current_root_path__no_root(self):
+        fast_api = self.setup_services(ISSUES__PATH='/repo/.issues')
+        assert fast_api.get_current_root_path() == '.issues'                     # ISSUES__PATH only reaches the providers
+        assert Issues_FS__Service_UI__Fast_API().get_current_root_path() == '.issues'
+
+    def test__resolve_config__env_read_once(self):
+        fast_api = Issues_FS__Service_UI__Fast_API()
+        assert self.resolve_config(fast_api, ISSUES__STORAGE='disk' )[0] == Enum__Issues_FS__Storage_Mode.DISK
+        assert self.resolve_config(fast_api, ISSUES__STORAGE='tmpfs')[0] == Enum__Issues_FS__Storage_Mode.DISK
@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+from unittest                                                        import TestCase
+from unittest.mock                                                   import patch
+from memory_fs.storage_fs.providers.Storage_FS__Local_Disk           import Storage_FS__Local_Disk
+from memory_fs.storage_fs.providers.Storage_FS__Memory               import Storage_FS__Memory
+from issues_fs_service_ui.fast_api.Issues_FS__Service_UI__Providers  import Issues_FS__Service_UI__Providers
+from issues_fs_service_ui.schemas.Enum__Issues_FS__Storage_Mode      import Enum__Issues_FS__Storage_Mode
+from issues_fs_service_ui.storage.Storage_FS__Local_Disk__Direct     import Storage_FS__Local_Disk__Direct
+
+MEMORY = Enum__Issues_FS__Storage_Mode.MEMORY
+TMPFS  = Enum__Issues_FS__Storage_Mode.TMPFS
+DISK   = Enum__Issues_FS__Storage_Mode.DISK
+
+
+class test_Issues_FS__Service_UI__Providers(TestCase):
+
+    def setUp(self):
+        self.folder      = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        self.issues_path = os.path.join(self.folder, '.issues')
+
+    def providers(self, storage_mode=MEMORY, direct_io=False):
+        return Issues_FS__Service_UI__Providers(storage_mode=storage_mode, issues_path=self.issues_path, direct_io=direct_io)
+
+    def test__storage_fs__memory(self):
+        assert type(self.providers(MEMORY).storage_fs()) is Storage_FS__Memory
+        assert os.path.exists(self.issues_path)         is False
+
+    def test__storage_fs__tmpfs(self):
+        storage_fs = self.providers(TMPFS, direct_io=True).storage_fs()          # direct_io is ignored outside disk mode
+        assert type(storage_fs)                 is Storage_FS__Local_Disk
+        assert str(storage_fs.root_path)        == self.issues_path
+        assert os.path.isdir(self.issues_path)  is True                          # Created on first use
+
+    def test__storage_fs__disk(self):
+        storage_fs = self.providers(DISK).storage_fs()
+        assert type(storage_fs)          is Storage_FS__Local_Disk
+        assert str(storage_fs.root_path) == self.issues_path
+
+    def test__storage_fs__disk__direct_io(self):
+        with patch('issues_fs_service_ui.storage.Storage_FS__Local_Disk__Direct.direct_io_supported', return_value=True):
+            assert type(self.providers(DISK, direct_io=True).storage_fs()) is Storage_FS__Local_Disk__Direct
+        with patch('issues_fs_service_ui.storage.Storage_FS__Local_Disk__Direct.direct_io_supported', return_value=False):
+            with self.assertLogs('issues_fs_service_ui.fast_api.Issues_FS__Service_UI__Providers', level='WARNING') as logs:
+                assert type(self.providers(DISK, direct_io=True).storage_fs()) is Storage_FS__Local_Disk
+        assert 'posix_fadvise is not available' in logs.output[0]
+
+    def test__path_handler__base_path(self):
+        assert str(self.providers(MEMORY).path_handler().base_path) == self.issues_path  # Memory storage needs the full prefix
+        assert str(self.providers(TMPFS ).path_handler().base_path) == ''
+        assert str(self.providers(DISK  ).path_handler().base_path) == ''
+
+    def test__built_once_per_instance(self):
+        providers = self.providers()
+        other     = self.providers()
+        assert providers.type_service()     is     providers.type_service()
+        assert providers.graph_repository() is not other.graph_repository()
+
+    def test__services_share_graph_repository(self):
+        with self.providers() as _:
+            repository = _.graph_repository()
+            assert repository.memory_fs                is _.memory_fs()
+            assert repository.memory_fs.storage_fs     is _.storage_fs()
+            for service in [_.type_service(), _.node_service(), _.link_service(), _.comments_service(),
+                            _.root_selection_service(), _.root_issue_service(), _.issue_children_service(),
+                            _.index_status_service()]:
+                assert service.repository is repository
+
+    def test__phase_1_services_share_path_handler(self):
+        with self.providers() as _:
+            assert _.phase_1_kwargs() is _.phase_1_kwargs()
+            for service in [_.root_selection_service(), _.root_issue_service(), _.issue_children_service()]:
+                assert service.path_handler is _.path_handler()
+
+    def test__server_status_service(self):
+        with self.providers() as _:
+            server_status = _.server_status_service()
+            assert server_status.storage_service            is _.storage_status_service()
+            assert server_status.git_service                is _.git_status_service    ()
+            assert server_status.types_service              is _.types_status_service  ()
+            assert server_status.index_service              is _.index_status_service  ()
+            assert _.storage_status_service().storage_fs    is _.storage_fs            ()
+            assert _.types_status_service  ().type_service  is _.type_service          ()
+            assert _.index_status_service  ().type_service  is _.type_service          ()
@@ -0,0 +1,127 @@
+import asyncio
+import os
+import shutil
+import tempfile
+from unittest                                                        import TestCase
+from unittest.mock                                                   import patch
+from starlette.exceptions                                            import HTTPException
+from starlette.staticfiles                                           import StaticFiles
+from issues_fs_service_ui.fast_api.StaticFiles__Cached               import StaticFiles__Cached, STATIC_FILES__CACHE_CONTROL
+
+
+def asgi_get(app, path, headers=None, method='GET'):                             # Raw ASGI call, returns (status, headers, body)
+    scope    = {'type'        : 'http'                                                        ,
+                'method'      : method                                                        ,
+                'path'        : path                                                          ,
+                'root_path'   : ''                                                            ,
+                'query_string': b''                                                           ,
+                'headers'     : [(name.encode(), value.encode()) for name, value in (headers or {}).items()]}
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start = messages[0]
+    body  = b''.join(message.get('body', b'') for message in messages[1:])
+    return start['status'], {name.decode(): value.decode() for name, value in start['headers']}, body
+
+
+class test_StaticFiles__Cached(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        os.makedirs(os.path.join(self.directory, 'v0', 'v0.1'))
+        self.write('v0/v0.1/index.html', '<html>index</html>')
+        self.write('other.js'          , 'console.log(42)'   )
+        self.static_files = StaticFiles__Cached(directory=self.directory, etag_version='v0.1.6')
+
+    def write(self, path, contents):
+        with open(os.path.join(self.directory, path), 'w') as file:
+            file.write(contents)
+
+    def test__file_response__version_etag_and_304(self):
+        status, headers, body = asgi_get(self.static_files, '/other.js')
+        assert status          == 200
+        assert body            == b'console.log(42)'
+        assert headers['etag'] == '"v0.1.6-15"'
+
+        status, headers, body = asgi_get(self.static_files, '/other.js', headers={'if-none-match': '"v0.1.6-15"'})
+        assert status          == 304
+        assert body            == b''
+        assert headers['etag'] == '"v0.1.6-15"'
+
+        status, _, _ = asgi_get(self.static_files, '/other.js', headers={'if-none-match': '"v0.1.5-15"'})
+        assert status == 200
+
+    def test__prewarm(self):
+        self.static_files.prewarm()
+        assert sorted(self.static_files.lookups) == ['other.js', os.path.join('v0', 'v0.1', 'index.html')]
+        with patch.object(StaticFiles, 'lookup_path') as lookup_path:            # Prewarmed paths never call the parent lookup (or os.stat)
+            status, _, _ = asgi_get(self.static_files, '/other.js')
+            assert status == 200
+            lookup_path.assert_not_called()
+
+    def test__lookup_path__caches_hits(self):
+        full_path, stat_result = self.static_files.lookup_path('other.js')
+        assert stat_result                              is not None
+        assert self.static_files.lookups['other.js']   == (full_path, stat_result)
+        assert self.static_files.lookup_path('other.js') is self.static_files.lookups['other.js']
+
+    def test__lookup_path__does_not_cache_misses(self):
+        assert self.static_files.lookup_path('missing.js')[1] is None
+        assert self.static_files.lookups                     == {}
+        with self.assertRaises(HTTPException) as context:                        # Turned into a 404 by the app's exception middleware
+            asgi_get(self.static_files, '/missing.js')
+        assert context.exception.status_code == 404
+        assert self.static_files.lookups     == {}
+
+        self.write('missing.js', 'added')                                        # A miss is looked up again on the next request
+        assert self.static_files.lookup_path('missing.js')[1] is not None
+
+    def test__lookup_path__cache_size_cap(self):
+        with patch('issues_fs_service_ui.fast_api.StaticFiles__Cached.STATIC_FILES__LOOKUP_CACHE_SIZE', 1):
+            self.static_files.lookup_path('other.js')
+            self.static_files.lookup_path(os.path.join('v0', 'v0.1', 'index.html'))
+        assert list(self.static_files.lookups) == ['other.js']
+
+    def test__preload__etag_304_and_cache_control(self):
+        self.static_files.preload('v0')
+        status, headers, body = asgi_get(self.static_files, '/v0/v0.1/index.html')
+        assert status                   == 200
+        assert body                     == b'<html>index</html>'
+        assert headers['etag']          == '"v0.1.6-18"'
+        assert headers['cache-control'] == STATIC_FILES__CACHE_CONTROL
+        assert headers['content-type'].startswith('text/html')
+
+        status, _, body = asgi_get(self.static_files, '/v0/v0.1/index.html', headers={'if-none-match': '"v0.1.6-18"'})
+        assert status == 304
+        assert body   == b''
+
+    def test__preload__new_response_per_request(self):                           # Middleware mutates response headers, so responses can't be shared
+        self.static_files.preload('v0')
+        scope      = {'type': 'http', 'method': 'GET', 'headers': []}
+        response_1 = asyncio.run(self.static_files.get_response(os.path.join('v0', 'v0.1', 'index.html'), scope))
+        response_2 = asyncio.run(self.static_files.get_response(os.path.join('v0', 'v0.1', 'index.html'), scope))
+        assert response_1 is not response_2
+        assert response_1.body == response_2.body == b'<html>index</html>'
+
+        response_1.headers['x-request-id'] = 'request-1'
+        response_3 = asyncio.run(self.static_files.get_response(os.path.join('v0', 'v0.1', 'index.html'), scope))
+        assert 'x-request-id' not in response_2.headers
+        assert 'x-request-id' not in response_3.headers
+
+    def test__preload__range_request_served_from_disk(self):
+        self.static_files.preload('v0')
+        status, headers, body = asgi_get(self.static_files, '/v0/v0.1/index.html', headers={'range': 'bytes=0-5'})
+        assert status                   == 206
+        assert body                     == b'<html>'
+        assert headers['content-range'] == 'bytes 0-5/18'
+
+    def test__prewarm__skips_preloaded_files(self):
+        self.static_files.preload('v0').prewarm()
+        assert list(self.static_files.lookups) == ['other.js']
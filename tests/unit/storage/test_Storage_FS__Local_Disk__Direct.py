@@ -0,0 +1,46 @@
+import os
+import shutil
+import tempfile
+from unittest                                                        import TestCase
+from unittest.mock                                                   import patch
+from issues_fs_service_ui.storage.Storage_FS__Local_Disk__Direct     import Storage_FS__Local_Disk__Direct, direct_io_supported
+
+
+class test_Storage_FS__Local_Disk__Direct(TestCase):
+
+    def setUp(self):
+        if direct_io_supported() is False:
+            self.skipTest('posix_fadvise not available')
+        self.root_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root_path, ignore_errors=True)
+        self.storage   = Storage_FS__Local_Disk__Direct(root_path=self.root_path)
+
+    def test__save_and_read(self):
+        assert self.storage.file__save('data/node.json', b'{"a": 42}') is True
+        assert self.storage.file__bytes('data/node.json') == b'{"a": 42}'
+        assert self.storage.file__str  ('data/node.json') == '{"a": 42}'
+        assert self.storage.file__json ('data/node.json') == {'a': 42}
+
+    def test__drop_page_cache__uses_full_path(self):                             # Leading '/' is stripped by full_path, like the reads and writes
+        self.storage.file__save('/data/node.json', b'{}')
+        with patch.object(os, 'posix_fadvise') as posix_fadvise:
+            self.storage.drop_page_cache('/data/node.json')
+        posix_fadvise.assert_called_once()
+
+    def test__drop_page_cache__uses_sanitised_path(self):                        # 'a b!' is stored as 'a b_', the fadvise must hit the same file
+        self.storage.file__save('a b!/c.json', b'{}')
+        assert os.path.isfile(os.path.join(self.root_path, 'a b_', 'c.json'))
+        with patch.object(os, 'posix_fadvise') as posix_fadvise:
+            assert self.storage.file__bytes('a b!/c.json') == b'{}'
+        posix_fadvise.assert_called_once()
+
+    def test__file__json__drops_page_cache_once(self):
+        self.storage.file__save('node.json', b'{}')
+        with patch.object(self.storage, 'drop_page_cache') as drop_page_cache:
+            assert self.storage.file__json('node.json') == {}
+        drop_page_cache.assert_called_once_with('node.json')
+
+    def test__drop_page_cache__missing_file(self):
+        with patch.object(os, 'posix_fadvise') as posix_fadvise:
+            self.storage.drop_page_cache('missing.json')
+        posix_fadvise.assert_not_called()